@@ -0,0 +1,283 @@
+"""
+Vectorised sun/moon elevation kernels.
+
+NumPy ports of the Astral formulas behind `astral.sun.elevation` (NOAA solar
+position) and `astral.moon.elevation` (van Flandern & Pulkkinen lunar series).
+Each kernel takes an array of Julian days (UTC) and evaluates every sample in
+one pass instead of one Python-level Astral call per sample. The solar transit
+solver does the same for a batch of target zenith angles on one date.
+
+When numba is installed (`pip install .[speedups]`) the math kernels are
+JIT-compiled and cached to disk; otherwise they run as plain NumPy.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from math import radians, sin
+from typing import Any, Callable
+
+import numpy as np
+from astral.julian import julianday
+from astral.sun import adjust_to_horizon
+from astral.table4 import Table4Row, table4_u, table4_v, table4_w
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional speed-up
+
+    def njit(*args: Any, **kwargs: Any) -> Callable[[Callable], Callable]:
+        def decorator(fn: Callable) -> Callable:
+            return fn
+
+        return decorator
+
+
+# ---------- Sun ----------
+
+
+@njit(cache=True, fastmath=True)
+def _solar_declination_and_eot(jd: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Solar declination (radians) and equation of time (minutes) for each JD."""
+    jc = (jd - 2451545.0) / 36525.0
+
+    mean_long = np.radians((280.46646 + jc * (36000.76983 + 0.0003032 * jc)) % 360.0)
+    mean_anomaly = np.radians(357.52911 + jc * (35999.05029 - 0.0001537 * jc))
+    eccentricity = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+    eq_of_center = (
+        np.sin(mean_anomaly) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+        + np.sin(2.0 * mean_anomaly) * (0.019993 - 0.000101 * jc)
+        + np.sin(3.0 * mean_anomaly) * 0.000289
+    )
+    omega = np.radians(125.04 - 1934.136 * jc)
+    apparent_long = np.radians(
+        np.degrees(mean_long) + eq_of_center - 0.00569 - 0.00478 * np.sin(omega)
+    )
+    seconds = 21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))
+    obliquity = np.radians(
+        23.0 + (26.0 + seconds / 60.0) / 60.0 + 0.00256 * np.cos(omega)
+    )
+    declination = np.arcsin(np.sin(obliquity) * np.sin(apparent_long))
+
+    y = np.tan(obliquity / 2.0) ** 2
+    eq_of_time = 4.0 * np.degrees(
+        y * np.sin(2.0 * mean_long)
+        - 2.0 * eccentricity * np.sin(mean_anomaly)
+        + 4.0 * eccentricity * y * np.sin(mean_anomaly) * np.cos(2.0 * mean_long)
+        - 0.5 * y * y * np.sin(4.0 * mean_long)
+        - 1.25 * eccentricity * eccentricity * np.sin(2.0 * mean_anomaly)
+    )
+    return declination, eq_of_time
+
+
+@njit(cache=True, fastmath=True)
+def _refraction(elevation: np.ndarray) -> np.ndarray:
+    """Astral's refraction_at_zenith in degrees, evaluated for every branch then selected."""
+    te = np.tan(np.radians(elevation))
+    te = np.where(te == 0.0, 1e-12, te)  # only reached by masked branches
+    high = 58.1 / te - 0.07 / te**3 + 0.000086 / te**5
+    mid = 1735.0 + elevation * (
+        -518.2 + elevation * (103.4 + elevation * (-12.79 + elevation * 0.711))
+    )
+    low = -20.774 / te
+    return np.where(
+        elevation >= 85.0,
+        0.0,
+        np.where(elevation > 5.0, high, np.where(elevation > -0.575, mid, low)) / 3600.0,
+    )
+
+
+@njit(cache=True, fastmath=True)
+def _solar_altitude(jd: np.ndarray, lat_rad: float, lon_deg: float) -> np.ndarray:
+    declination, eq_of_time = _solar_declination_and_eot(jd)
+
+    # Minutes past UTC midnight; the hour angle only enters through cos(), so
+    # no wrapping into [-180, 180) is needed.
+    utc_minutes = ((jd + 0.5) % 1.0) * 1440.0
+    hour_angle = np.radians((utc_minutes + eq_of_time + 4.0 * lon_deg) / 4.0 - 180.0)
+
+    cos_zenith = np.cos(lat_rad) * np.cos(declination) * np.cos(hour_angle) + np.sin(
+        lat_rad
+    ) * np.sin(declination)
+    zenith = np.degrees(np.arccos(np.minimum(np.maximum(cos_zenith, -1.0), 1.0)))
+
+    elevation = 90.0 - zenith
+    return elevation + _refraction(elevation)
+
+
+# No fastmath: unreachable zeniths are signalled by NaN from arccos, which
+# fastmath would let the compiler assume away.
+@njit(cache=True)
+def _solar_transit(
+    jd0: float,
+    lat_rad: float,
+    lon_deg: float,
+    zenith_rad: np.ndarray,
+    setting: np.ndarray,
+) -> np.ndarray:
+    minutes = np.zeros_like(zenith_rad)
+    adjustment = np.zeros_like(zenith_rad)
+    for _ in range(2):  # same fixed-point refinement as Astral
+        declination, eq_of_time = _solar_declination_and_eot(jd0 + adjustment)
+        cos_hour_angle = (np.cos(zenith_rad) - np.sin(lat_rad) * np.sin(declination)) / (
+            np.cos(lat_rad) * np.cos(declination)
+        )
+        hour_angle = np.arccos(cos_hour_angle)
+        hour_angle = np.where(setting, -hour_angle, hour_angle)
+        offset = (-lon_deg - np.degrees(hour_angle)) * 4.0 - eq_of_time
+        offset = np.where(offset < -720.0, offset + 1440.0, offset)
+        minutes = 720.0 + offset
+        adjustment = minutes / 1440.0
+    return minutes
+
+
+def sun_elevation(jd: np.ndarray, latitude: float, longitude: float) -> np.ndarray:
+    """Apparent solar elevation in degrees (refraction-corrected) for each JD."""
+    return _solar_altitude(jd, radians(min(max(latitude, -89.8), 89.8)), longitude)
+
+
+def sun_transit_minutes(
+    on_date: date,
+    latitude: float,
+    longitude: float,
+    elevation_m: float,
+    zeniths: np.ndarray,
+    setting: np.ndarray,
+) -> np.ndarray:
+    """
+    UTC minutes after midnight of `on_date` at which the sun crosses each of
+    `zeniths` (degrees), rising or setting per the `setting` mask. NaN where
+    the sun never reaches that zenith. Batched `astral.sun.time_of_transit`.
+    """
+    zeniths = zeniths + adjust_to_horizon(elevation_m)
+    zeniths = zeniths + _refraction(90.0 - zeniths)
+    with np.errstate(invalid="ignore"):  # plain-NumPy path warns on the NaNs
+        return _solar_transit(
+            julianday(on_date),
+            radians(min(max(latitude, -89.8), 89.8)),
+            longitude,
+            np.radians(zeniths),
+            setting,
+        )
+
+
+# ---------- Moon ----------
+
+# Astral's lunar series arguments, in revolutions, keyed by `astral.table4`
+# argument number. 5 (Om) has no rate of its own: it is derived as Lm - Fm.
+_ARG_KEYS: tuple[int, ...] = (1, 2, 3, 4, 5, 7, 8, 12)
+_ARG_OFFSETS = np.array(
+    [0.606434, 0.374897, 0.259091, 0.827362, 0.0, 0.779072, 0.993126, 0.505498]
+)
+_ARG_RATES = np.array(
+    [
+        0.03660110129,  # Lm  moon mean longitude
+        0.03629164709,  # Gm  moon mean anomaly
+        0.03674819520,  # Fm  moon argument of latitude
+        0.03386319198,  # D   moon mean elongation from sun
+        0.0,  # Om  longitude of the lunar ascending node
+        0.00273790931,  # Ls  sun mean longitude
+        0.00273777850,  # Gs  sun mean anomaly
+        0.00445046867,  # L2  venus mean longitude
+    ]
+)
+
+
+def _pack_tables(
+    *tables: list[Table4Row],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Flatten Astral's V/U/W tables into parallel arrays for one-pass evaluation."""
+    rows = [row for table in tables for row in table]
+    multipliers = np.array(
+        [[row.argument_multiplers.get(k, 0) for k in _ARG_KEYS] for row in rows],
+        dtype=np.float64,
+    )
+    coefficients = np.array([row.coefficient for row in rows])
+    t_flags = np.array([1.0 if row.t else 0.0 for row in rows])
+    sin_flags = np.array([1.0 if row.sincos is sin else 0.0 for row in rows])
+    bounds = np.cumsum([len(table) for table in tables])
+    return multipliers, coefficients, t_flags, sin_flags, bounds
+
+
+_MULTIPLIERS, _COEFFICIENTS, _T_FLAGS, _SIN_FLAGS, _BOUNDS = _pack_tables(
+    table4_v, table4_u, table4_w
+)
+
+
+@njit(cache=True, fastmath=True)
+def _lunar_altitude(
+    jd: np.ndarray,
+    lat_rad: float,
+    lon_deg: float,
+    multipliers: np.ndarray,
+    coefficients: np.ndarray,
+    t_flags: np.ndarray,
+    sin_flags: np.ndarray,
+    bounds: np.ndarray,
+) -> np.ndarray:
+    jd2000 = jd - 2451545.0
+    n = jd2000.shape[0]
+
+    args = np.empty((n, _ARG_OFFSETS.shape[0]))
+    for k in range(_ARG_OFFSETS.shape[0]):
+        raw = _ARG_OFFSETS[k] + _ARG_RATES[k] * jd2000
+        args[:, k] = raw - np.trunc(raw)  # Astral uses x - int(x), not x % 1
+    args[:, 4] = args[:, 0] - args[:, 2]
+
+    angle = np.zeros((n, multipliers.shape[0]))
+    for k in range(multipliers.shape[1]):
+        angle += np.outer(args[:, k], multipliers[:, k])
+    angle *= 2.0 * np.pi
+    t = (jd2000 / 36525.0 + 1.0).reshape((n, 1))
+    scale = coefficients * (t_flags * t + (1.0 - t_flags))
+    terms = (sin_flags * np.sin(angle) + (1.0 - sin_flags) * np.cos(angle)) * scale
+
+    v = terms[:, : bounds[0]].sum(axis=1)
+    u = terms[:, bounds[0] : bounds[1]].sum(axis=1)
+    w = terms[:, bounds[1] : bounds[2]].sum(axis=1)
+    right_ascension = np.arcsin(w / np.sqrt(u - v * v)) + args[:, 0] * 2.0 * np.pi
+    declination = np.arcsin(v / np.sqrt(u))
+
+    t0 = jd2000 / 36525.0
+    gmst = (
+        280.46061837 + 360.98564736629 * jd2000 + 0.000387933 * t0**2 + t0**3 / 38710000
+    ) % 360.0
+    hour_angle = np.radians(gmst + lon_deg) - right_ascension
+
+    sh, ch = np.sin(hour_angle), np.cos(hour_angle)
+    sd, cd = np.sin(declination), np.cos(declination)
+    sl, cl = np.sin(lat_rad), np.cos(lat_rad)
+    x = -ch * cd * sl + sd * cl
+    y = -sh * cd
+    z = ch * cd * cl + sd * sl
+    return np.degrees(np.arctan2(z, np.sqrt(x * x + y * y)))
+
+
+def moon_elevation(jd: np.ndarray, latitude: float, longitude: float) -> np.ndarray:
+    """Geocentric lunar elevation in degrees for each JD."""
+    return _lunar_altitude(
+        jd,
+        radians(latitude),
+        longitude,
+        _MULTIPLIERS,
+        _COEFFICIENTS,
+        _T_FLAGS,
+        _SIN_FLAGS,
+        _BOUNDS,
+    )
+
+
+def warm_up() -> None:
+    """
+    Run each kernel once so numba compiles (or loads from its disk cache)
+    before the first request instead of during it. Inputs mirror the real
+    call sites, including the read-only JD array, so the same signatures are
+    built. A no-op cost without numba.
+    """
+    jd = np.linspace(2451545.0, 2451546.0, 24)
+    jd.setflags(write=False)
+    sun_elevation(jd, 0.0, 0.0)
+    moon_elevation(jd, 0.0, 0.0)
+    sun_transit_minutes(
+        date(2000, 1, 1), 0.0, 0.0, 0.0, np.array([96.0, 84.0]), np.array([False, True])
+    )
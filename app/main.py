@@ -1,27 +1,51 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
+import math
 import sys
-from datetime import date, datetime, timezone
+from contextlib import asynccontextmanager, suppress
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache, partial
 from pathlib import Path
-from time import perf_counter
-from typing import Any, Callable, Optional
+from time import monotonic, perf_counter_ns
+from typing import Any, AsyncIterator, Callable, Optional
 
 import uvicorn
 import yaml
 import httpx
+import numpy as np
 from astral import Observer, moon
 from astral import sun as astral_sun
-from fastapi import FastAPI, HTTPException, Query
+from astral.sun import SUN_APPARENT_RADIUS, minutes_to_timedelta
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from zoneinfo import ZoneInfo
+from pydantic import TypeAdapter, ValidationError
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from timezonefinder import TimezoneFinder
 
 try:
+    from tzfpy import get_tz  # Rust polygon index, several times faster per lookup
+except ImportError:  # optional speed-up; timezonefinder is the fallback
+    get_tz = None
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+try:
+    from app import astro_kernels
     from app.models import (
+        AstroDay,
         AstroQuery,
+        AstroRangeQuery,
+        AstroRangeResponse,
         AstroResponse,
         SunTimes,
         MoonInfo,
@@ -33,6 +57,8 @@ try:
         WeatherCurrent,
         WeatherCondition,
         WeatherForecast,
+        WeatherApiCondition,
+        WeatherApiPayload,
         ForecastDay,
     )
     from app.settings import settings
@@ -41,8 +67,12 @@ except ModuleNotFoundError:
     project_root = Path(__file__).resolve().parent.parent
     if str(project_root) not in sys.path:
         sys.path.insert(0, str(project_root))
+    from app import astro_kernels
     from app.models import (
+        AstroDay,
         AstroQuery,
+        AstroRangeQuery,
+        AstroRangeResponse,
         AstroResponse,
         SunTimes,
         MoonInfo,
@@ -54,6 +84,8 @@ except ModuleNotFoundError:
         WeatherCurrent,
         WeatherCondition,
         WeatherForecast,
+        WeatherApiCondition,
+        WeatherApiPayload,
         ForecastDay,
     )
     from app.settings import settings
@@ -67,7 +99,19 @@ logging.basicConfig(
 logger = logging.getLogger("astro-api")
 
 # ---------- App ----------
-app = FastAPI(title=settings.app_name)
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Compile the elevation kernels up front; otherwise the first /astro pays for it.
+    astro_kernels.warm_up()
+    # Likewise parse the links file now; a bad file still surfaces on /links.
+    with suppress(HTTPException):
+        load_links_yaml(settings.links_file)
+    yield
+    if _weather_client is not None:
+        await _weather_client.aclose()
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 WEB_ROOT = Path(__file__).resolve().parent.parent / "web"
 FAVICONS_DIR = WEB_ROOT / "favicons"
@@ -83,51 +127,103 @@ app.add_middleware(
 # Mount static files for favicons
 app.mount("/favicons", StaticFiles(directory=FAVICONS_DIR), name="favicons")
 
-_tzf = TimezoneFinder(in_memory=True)
+if settings.timezone_backend == "tzfpy" and get_tz is None:
+    logger.warning("TIMEZONE_BACKEND=tzfpy but tzfpy is not installed; using timezonefinder")
+if settings.timezone_backend == "timezonefinder":
+    get_tz = None  # timezonefinder is more exact right at timezone borders
 SunDirection = getattr(astral_sun, "SunDirection")
 
 # ---------- Utilities ----------
 
 
+@lru_cache(maxsize=512)
+def _zi(name: str) -> ZoneInfo:
+    """Shared ZoneInfo per IANA name; instances are immutable and thread-safe."""
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=4096)
+def _observer(lat: float, lon: float, elevation_m: float) -> Observer:
+    """
+    Shared Observer per location. Observer validates and converts every field
+    on assignment; callers pass grid-quantised values (see _astro_core), so
+    sun and moon, and every date at that spot, reuse one instance. Treat the
+    result as read-only.
+    """
+    return Observer(latitude=lat, longitude=lon, elevation=elevation_m)
+
+
+@lru_cache(maxsize=1)
+def _timezone_finder() -> TimezoneFinder:
+    """
+    Built on first use, so workers that never resolve a timezone (or use
+    tzfpy) do not pay for it. By default the polygon data stays in the
+    memory-mapped files, whose pages the OS shares between workers.
+    """
+    return TimezoneFinder(in_memory=settings.timezone_in_memory)
+
+
+@lru_cache(maxsize=16384)
+def _tz_lookup(lat_q: int, lon_q: int) -> Optional[str]:
+    """
+    Polygon lookup on a 0.01° (~1 km) grid; keys are lat/lon scaled by 100.
+    Timezone borders are stable at that resolution, so repeat polls from the
+    same area become a dict hit instead of a point-in-polygon test. Entries
+    are two ints and an interned name, so 16k of them stay around a megabyte.
+    """
+    lat, lon = lat_q / 100, lon_q / 100
+    if get_tz is not None:
+        return get_tz(lon, lat) or None  # tzfpy takes (lng, lat)
+    return _timezone_finder().timezone_at(lat=lat, lng=lon)
+
+
 def resolve_timezone(lat: float, lon: float) -> str:
     """
-    Find IANA timezone for the given lat/lon.
-    Tries exact first, then nearest. Raises HTTPException if not found.
+    Find IANA timezone for the given lat/lon via the grid-cached polygon
+    lookup. Falls back to UTC (with a warning) where no zone matches.
     """
-    tz = _tzf.timezone_at(lat=lat, lng=lon)
-    if not tz:
-        # Set to UTC if no timezone found
-        logger.warning("Exact TZ lookup failed for lat=%s, lon=%s - Using UTC", lat, lon)
-        tz = 'UTC'
+    tz = _tz_lookup(round(lat * 100), round(lon * 100))
     if not tz:
-        logger.warning("Failed to resolve timezone for lat=%s, lon=%s", lat, lon)
-        raise HTTPException(
-            status_code=400, detail="Unable to resolve timezone for the given location."
-        )
+        logger.warning("TZ lookup failed for lat=%s, lon=%s - Using UTC", lat, lon)
+        tz = "UTC"
     return tz
 
 
+@lru_cache(maxsize=4096)
+def _moon_phase(ordinal: int) -> float:
+    """Astral moon phase (0-27.99) for a date ordinal; identical for every caller."""
+    return moon.phase(date.fromordinal(ordinal))
+
+
+def _phase_day(on_date: date) -> int:
+    """Phase day rounded half-up; the phase is never negative, so int() floors."""
+    return int(_moon_phase(on_date.toordinal()) + 0.5)
+
+
+_PHASE_NAMES: tuple[str, ...] = (
+    ("New Moon",)
+    + ("Waxing Crescent",) * 6  # 1-6
+    + ("First Quarter",)
+    + ("Waxing Gibbous",) * 6  # 8-13
+    + ("Full Moon",)
+    + ("Waning Gibbous",) * 6  # 15-20
+    + ("Last Quarter",)
+    + ("Waning Crescent",) * 8  # 22-29
+)
+
+
 def moon_phase_name(phase_day_0_29: int) -> str:
     """
     Map Astral’s 0..29 phase day to a human-readable name.
     The boundaries are conventional; there’s no single canonical mapping.
     """
-    d = phase_day_0_29 % 30
-    if d == 0:
-        return "New Moon"
-    if 1 <= d <= 6:
-        return "Waxing Crescent"
-    if d == 7:
-        return "First Quarter"
-    if 8 <= d <= 13:
-        return "Waxing Gibbous"
-    if d == 14:
-        return "Full Moon"
-    if 15 <= d <= 20:
-        return "Waning Gibbous"
-    if d == 21:
-        return "Last Quarter"
-    return "Waning Crescent"  # 22-29
+    return _PHASE_NAMES[phase_day_0_29 % 30]
+
+
+# (1 - cos(θ)) / 2 with 0..29 mapped onto 0..2π over a ~29.53 day synodic month.
+_ILLUMINATION: tuple[float, ...] = tuple(
+    max(0.0, min(1.0, (1 - math.cos(d * (2 * math.pi / 29.53))) / 2)) for d in range(30)
+)
 
 
 def approx_illumination(phase_day_0_29: int) -> float:
@@ -136,16 +232,22 @@ def approx_illumination(phase_day_0_29: int) -> float:
     0..29 mapped onto 0..2π, illumination ≈ (1 - cos(θ)) / 2
     This isn't precise astronomy, but close enough for a dashboard.
     """
-    import math
+    return _ILLUMINATION[phase_day_0_29 % 30]
 
-    theta = (phase_day_0_29 % 30) * (2 * math.pi / 29.53)  # synodic month ~29.53 days
-    return max(0.0, min(1.0, (1 - math.cos(theta)) / 2))
+
+# Astral phase units (0..28 per synodic month) gained per day on average.
+_PHASE_RATE = 28 / 29.530588
 
 
 def find_next_moon_phase(from_date: date, target_phase: int, max_days: int = 60) -> date:
     """
     Find the next occurrence of a specific moon phase.
 
+    Rather than stepping through every day, jump to a few days before the date
+    the mean synodic rate predicts and scan from there. Astral's phase only
+    drifts ~1.7 days from that prediction, and it is monotonic within a cycle,
+    so no earlier day can match and the result is the same as a full scan.
+
     Args:
         from_date: Starting date to search from
         target_phase: Target phase day (0=new moon, 7=first quarter, 14=full moon, 21=last quarter)
@@ -154,21 +256,20 @@ def find_next_moon_phase(from_date: date, target_phase: int, max_days: int = 60)
     Returns:
         Date of the next occurrence of the target phase
     """
-    current_date = from_date
+    # Tomorrow can still round to the target if today is already inside its window.
+    if max_days >= 1 and _phase_day(from_date + timedelta(days=1)) == target_phase:
+        return from_date + timedelta(days=1)
 
-    for _ in range(max_days):
-        current_date = current_date + __import__('datetime').timedelta(days=1)
-        phase = int(round(moon.phase(current_date)))
-
-        # Check if we've hit the target phase
-        # Account for phase wrapping (29 -> 0)
-        if phase == target_phase:
-            return current_date
+    window_start = max(target_phase - 0.5, 0.0)
+    predicted = ((window_start - _moon_phase(from_date.toordinal())) % 28) / _PHASE_RATE
+    for offset in range(max(2, int(predicted) - 3), max_days + 1):
+        candidate = from_date + timedelta(days=offset)
+        if _phase_day(candidate) == target_phase:
+            return candidate
 
     # Fallback: return approximate date based on lunar cycle
     # Average lunar cycle is 29.53 days
-    from datetime import timedelta
-    current_phase = int(round(moon.phase(from_date)))
+    current_phase = _phase_day(from_date)
     days_to_target = (target_phase - current_phase) % 30
     if days_to_target == 0 and current_phase != target_phase:
         days_to_target = 30
@@ -176,49 +277,220 @@ def find_next_moon_phase(from_date: date, target_phase: int, max_days: int = 60)
 
 
 def _record_metric(
-    metrics: Optional[dict[str, float]], key: str, start_time: float
+    metrics: Optional[dict[str, float]], key: str, start_ns: int
 ) -> None:
     if metrics is None:
         return
-    metrics[key] = round((perf_counter() - start_time) * 1000.0, 4)
+    # ns -> ms at 4 decimals in integer math; ~6x cheaper than round(x, 4).
+    metrics[key] = (perf_counter_ns() - start_ns + 50) // 100 / 10_000
+
+
+@lru_cache(maxsize=1024)
+def _hourly_samples(on_date: date, tz_name: str) -> tuple[tuple[str, ...], np.ndarray]:
+    """
+    The 24 local-hour sample instants for a date/timezone: their ISO strings
+    (series keys) and matching UTC Julian days (kernel input). Shared by the
+    sun and moon series and by every request for the same day.
+    """
+    tzinfo = _zi(tz_name)
+    samples = [
+        datetime(on_date.year, on_date.month, on_date.day, hour, tzinfo=tzinfo)
+        for hour in range(24)
+    ]
+    jd = np.array([sample.timestamp() for sample in samples]) / 86400.0 + 2440587.5
+    jd.setflags(write=False)
+    return tuple(sample.isoformat() for sample in samples), jd
 
 
 def build_hourly_elevation_series(
     observer: Observer,
     tzinfo: ZoneInfo,
     on_date: date,
-    compute_fn: Callable[[Observer, datetime], float],
+    kernel: Callable[[np.ndarray, float, float], np.ndarray],
     metrics: Optional[dict[str, float]] = None,
     prefix: Optional[str] = None,
-) -> dict[str, float]:
-    """
-    Produce a mapping of ISO timestamps (hourly) to elevation angles in degrees.
-    Uses timezone-aware datetimes aligned to the provided tzinfo.
-    """
-    series_start = perf_counter()
-    label = prefix or compute_fn.__name__
-    series: dict[str, float] = {}
-    for hour in range(24):
-        sample = datetime(
-            on_date.year,
-            on_date.month,
-            on_date.day,
-            hour,
-            tzinfo=tzinfo,
+) -> dict[str, int]:
+    """
+    Produce a mapping of ISO timestamps (hourly) to elevation angles in
+    hundredths of a degree (int16 range; divide by 100 for degrees).
+    Uses timezone-aware datetimes aligned to the provided tzinfo; all 24 samples
+    are evaluated in a single vectorised `kernel` call (see app.astro_kernels).
+    """
+    series_start = perf_counter_ns()
+    label = prefix or kernel.__name__
+    keys, jd = _hourly_samples(on_date, tzinfo.key)
+    elevation = kernel(jd, observer.latitude, observer.longitude)
+    valid = ~np.isnan(elevation)
+    if not valid.all():
+        # Drop unusable samples with one log line instead of failing the series.
+        logger.debug(
+            "Elevation series %s on %s has no value at %s",
+            label,
+            on_date,
+            [key for key, ok in zip(keys, valid.tolist()) if not ok],
         )
-        try:
-            value = compute_fn(observer, sample)
-        except Exception as err:
+        keys = tuple(key for key, ok in zip(keys, valid.tolist()) if ok)
+        elevation = elevation[valid]
+    centidegrees = np.rint(elevation * 100.0).astype(np.int16)
+    series = dict(zip(keys, centidegrees.tolist()))
+    _record_metric(metrics, f"{label}.total_ms", series_start)
+    return series
+
+
+TWILIGHT_DEPRESSIONS: dict[str, float] = {
+    "civil": 6.0,
+    "nautical": 12.0,
+    "astronomical": 18.0,
+}
+
+
+def _safe_event(
+    fn: Callable[..., datetime], *args: Any, **kwargs: Any
+) -> Optional[datetime]:
+    try:
+        return fn(*args, **kwargs)
+    except ValueError:
+        # Event does not occur on this date (polar day/night, white nights).
+        return None
+
+
+def _transit_times(
+    observer: Observer,
+    on_date: date,
+    tzinfo: ZoneInfo,
+    zeniths: np.ndarray,
+    setting: np.ndarray,
+) -> list[Optional[datetime]]:
+    """Local times of one batched transit solve; None where the zenith is never reached."""
+    minutes = astro_kernels.sun_transit_minutes(
+        on_date, observer.latitude, observer.longitude, observer.elevation, zeniths, setting
+    )
+    utc_midnight = datetime(on_date.year, on_date.month, on_date.day, tzinfo=timezone.utc)
+    return [
+        None if math.isnan(m) else (utc_midnight + minutes_to_timedelta(m)).astimezone(tzinfo)
+        for m in minutes.tolist()
+    ]
+
+
+# Sun zenith angles bounding each photographic window, in rising order
+# (blue hour: -6° to -4° elevation, golden hour: -4° to +6°).
+PERIOD_ZENITHS: dict[str, tuple[float, float]] = {
+    "blue_hour": (96.0, 94.0),
+    "golden_hour": (94.0, 84.0),
+}
+
+# Every distinct zenith a date needs: the horizon (sunrise/sunset), each
+# twilight depression (dawn/dusk) and the window edges. Shared angles, such as
+# civil twilight and the outer edge of blue hour, are solved once.
+_ZENITHS: tuple[float, ...] = tuple(
+    dict.fromkeys(
+        [90.0 + SUN_APPARENT_RADIUS]
+        + [90.0 + depression for depression in TWILIGHT_DEPRESSIONS.values()]
+        + [zenith for edges in PERIOD_ZENITHS.values() for zenith in edges]
+    )
+)
+# One batch: every zenith rising, then every zenith setting.
+_TRANSIT_ZENITHS = np.array(_ZENITHS * 2)
+_TRANSIT_SETTING = np.array([False] * len(_ZENITHS) + [True] * len(_ZENITHS))
+
+
+def _slot(zenith: float, setting: bool) -> int:
+    """Position of a (zenith, direction) transit in the batch."""
+    return _ZENITHS.index(zenith) + (len(_ZENITHS) if setting else 0)
+
+
+# (rising, setting) slots for sunrise/sunset and each depression's dawn/dusk.
+_HORIZON_SLOTS = (_slot(_ZENITHS[0], False), _slot(_ZENITHS[0], True))
+_TWILIGHT_SLOTS: dict[str, tuple[int, int]] = {
+    name: (_slot(90.0 + depression, False), _slot(90.0 + depression, True))
+    for name, depression in TWILIGHT_DEPRESSIONS.items()
+}
+_EVENT_SLOTS = np.array(
+    sorted({slot for slots in (_HORIZON_SLOTS, *_TWILIGHT_SLOTS.values()) for slot in slots})
+)
+# (start, end) slots per window and direction; a setting sun crosses the
+# zeniths in reverse order.
+_PERIOD_SLOTS: dict[tuple[str, Any], tuple[int, int]] = {
+    (name, direction): (
+        (_slot(second, True), _slot(first, True))
+        if direction == SunDirection.SETTING
+        else (_slot(first, False), _slot(second, False))
+    )
+    for name, (first, second) in PERIOD_ZENITHS.items()
+    for direction in (SunDirection.RISING, SunDirection.SETTING)
+}
+
+
+def _sun_transits(
+    observer: Observer,
+    on_date: date,
+    tzinfo: ZoneInfo,
+    metrics: Optional[dict[str, float]] = None,
+    prefix: str = "sun",
+) -> tuple[dict[str, dict[str, Optional[datetime]]], dict[tuple[str, Any], Optional[TimePeriod]]]:
+    """
+    Sun events per twilight depression, plus blue and golden hour keyed by
+    (window, SunDirection), from one batched transit solve.
+
+    Instead of separate Astral calls for sunrise, sunset, each depression's
+    dawn/dusk and each window edge, every distinct zenith is solved once per
+    direction; the iteration matches Astral's `time_of_transit`, so times are
+    unchanged. As in Astral, an event (not a window edge) that lands on
+    another local date is re-solved from the neighbouring UTC day (again
+    batched) and dropped if it still misses. Anything the sun never reaches on
+    this date is None on its own, so e.g. a missing astronomical dusk in a
+    summer night does not wipe out sunrise/sunset.
+    """
+    step = perf_counter_ns()
+    raw = _transit_times(observer, on_date, tzinfo, _TRANSIT_ZENITHS, _TRANSIT_SETTING)
+
+    periods: dict[tuple[str, Any], Optional[TimePeriod]] = {}
+    for (name, direction), (start_slot, end_slot) in _PERIOD_SLOTS.items():
+        start, end = raw[start_slot], raw[end_slot]
+        if start is None or end is None:
             logger.debug(
-                "Elevation sample failed for %s at %s: %s",
-                compute_fn.__name__,
-                sample.isoformat(),
-                err,
+                "%s (%s) unavailable for lat=%s lon=%s",
+                name,
+                direction.name,
+                observer.latitude,
+                observer.longitude,
             )
+            periods[(name, direction)] = None
+        else:
+            periods[(name, direction)] = TimePeriod(start=start, end=end)
+
+    times = list(raw)
+    for delta in (1, -1):
+        retry = [
+            slot
+            for slot in _EVENT_SLOTS.tolist()
+            if (t := times[slot]) is not None
+            and t.date() != on_date
+            and (t.date() < on_date) == (delta == 1)
+        ]
+        if not retry:
             continue
-        series[sample.isoformat()] = round(float(value), 4)
-    _record_metric(metrics, f"{label}.total_ms", series_start)
-    return series
+        again = _transit_times(
+            observer,
+            on_date + timedelta(days=delta),
+            tzinfo,
+            _TRANSIT_ZENITHS[retry],
+            _TRANSIT_SETTING[retry],
+        )
+        for slot, t in zip(retry, again):
+            times[slot] = t if t is not None and t.date() == on_date else None
+
+    shared = {
+        "sunrise": times[_HORIZON_SLOTS[0]],
+        "noon": _safe_event(astral_sun.noon, observer, on_date, tzinfo),
+        "sunset": times[_HORIZON_SLOTS[1]],
+    }
+    events = {
+        name: {**shared, "dawn": times[dawn], "dusk": times[dusk]}
+        for name, (dawn, dusk) in _TWILIGHT_SLOTS.items()
+    }
+    _record_metric(metrics, f"{prefix}.sun_transits_ms", step)
+    return events, periods
 
 
 def compute_sun_times(
@@ -234,99 +506,32 @@ def compute_sun_times(
     Uses Astral to compute sun event times for a location/date, including
     civil/nautical/astronomical twilight boundaries. Handles polar edge-cases by
     returning None where events do not occur instead of raising.
+    The result does not depend on the wall clock: `is_daylight_now` is left
+    unset for the route to fill in (see `is_daylight`).
     """
-    overall_start = perf_counter()
-    tzinfo = ZoneInfo(tz_name)
-    observer = Observer(latitude=lat, longitude=lon, elevation=elevation_m)
+    overall_start = perf_counter_ns()
+    tzinfo = _zi(tz_name)
+    observer = _observer(lat, lon, elevation_m)
     try:
-        step = perf_counter()
-        base = astral_sun.sun(observer=observer, date=on_date, tzinfo=tzinfo)
-        _record_metric(metrics, f"{prefix}.sun_civil_ms", step)
-        civil = base  # Astral default: civil twilight (sun at -6°)
-        step = perf_counter()
-        nautical = astral_sun.sun(
-            observer=observer,
-            date=on_date,
-            tzinfo=tzinfo,
-            dawn_dusk_depression=12,
-        )
-        _record_metric(metrics, f"{prefix}.sun_nautical_ms", step)
-        step = perf_counter()
-        astronomical = astral_sun.sun(
-            observer=observer,
-            date=on_date,
-            tzinfo=tzinfo,
-            dawn_dusk_depression=18,
+        events, periods = _sun_transits(
+            observer, on_date, tzinfo, metrics=metrics, prefix=prefix
         )
-        _record_metric(metrics, f"{prefix}.sun_astronomical_ms", step)
+        civil = events["civil"]  # Astral default: civil twilight (sun at -6°)
+        nautical = events["nautical"]
+        astronomical = events["astronomical"]
 
-        # day length might be negative/KeyError at poles; calculate defensively
-        sunrise = civil.get("sunrise")
-        sunset = civil.get("sunset")
+        # Any event may be None at high latitudes; calculate defensively
+        sunrise, sunset = civil["sunrise"], civil["sunset"]
+        c_dawn, c_noon, c_dusk = civil["dawn"], civil["noon"], civil["dusk"]
         day_len = (
             int((sunset - sunrise).total_seconds()) if sunrise and sunset else None
         )
-        now_local = datetime.now(tz=tzinfo)
-        is_day = (
-            sunrise is not None
-            and sunset is not None
-            and sunrise <= now_local <= sunset
-        )
-        def safe_period(
-            factory: Callable[..., tuple[datetime, datetime]],
-            direction: Any,
-        ) -> Optional[TimePeriod]:
-            label = getattr(direction, "name", str(direction))
-            period_start = perf_counter()
-            try:
-                start, end = factory(
-                    observer=observer,
-                    date=on_date,
-                    direction=direction,
-                    tzinfo=tzinfo,
-                )
-                _record_metric(
-                    metrics,
-                    f"{prefix}.{factory.__name__}_{label.lower()}_ms",
-                    period_start,
-                )
-                return TimePeriod(start=start, end=end)
-            except ValueError:
-                # Twilight window may not exist at high latitudes on some dates.
-                logger.debug(
-                    "%s twilight (%s) unavailable for lat=%s lon=%s",
-                    factory.__name__,
-                    label,
-                    lat,
-                    lon,
-                )
-                _record_metric(
-                    metrics,
-                    f"{prefix}.{factory.__name__}_{label.lower()}_ms",
-                    period_start,
-                )
-                return None
-            except Exception as err:
-                logger.debug(
-                    "%s twilight computation failed: %s", factory.__name__, err
-                )
-                _record_metric(
-                    metrics,
-                    f"{prefix}.{factory.__name__}_{label.lower()}_ms",
-                    period_start,
-                )
-                return None
-
-        blue_morning = safe_period(astral_sun.blue_hour, SunDirection.RISING)
-        blue_evening = safe_period(astral_sun.blue_hour, SunDirection.SETTING)
-        golden_morning = safe_period(astral_sun.golden_hour, SunDirection.RISING)
-        golden_evening = safe_period(astral_sun.golden_hour, SunDirection.SETTING)
 
         solar_series = build_hourly_elevation_series(
             observer=observer,
             tzinfo=tzinfo,
             on_date=on_date,
-            compute_fn=astral_sun.elevation,
+            kernel=astro_kernels.sun_elevation,
             metrics=metrics,
             prefix=f"{prefix}.elevation_series",
         )
@@ -334,23 +539,22 @@ def compute_sun_times(
         return SunTimes(
             timezone=tz_name,
             date=on_date,
-            dawn=civil.get("dawn"),
+            dawn=c_dawn,
             sunrise=sunrise,
-            solar_noon=civil.get("noon"),
+            solar_noon=c_noon,
             sunset=sunset,
-            dusk=civil.get("dusk"),
+            dusk=c_dusk,
             day_length_seconds=day_len,
-            is_daylight_now=is_day,
-            civil_dawn=civil.get("dawn"),
-            civil_dusk=civil.get("dusk"),
-            nautical_dawn=nautical.get("dawn"),
-            nautical_dusk=nautical.get("dusk"),
-            astronomical_dawn=astronomical.get("dawn"),
-            astronomical_dusk=astronomical.get("dusk"),
-            blue_hour_morning=blue_morning,
-            blue_hour_evening=blue_evening,
-            golden_hour_morning=golden_morning,
-            golden_hour_evening=golden_evening,
+            civil_dawn=c_dawn,
+            civil_dusk=c_dusk,
+            nautical_dawn=nautical["dawn"],
+            nautical_dusk=nautical["dusk"],
+            astronomical_dawn=astronomical["dawn"],
+            astronomical_dusk=astronomical["dusk"],
+            blue_hour_morning=periods[("blue_hour", SunDirection.RISING)],
+            blue_hour_evening=periods[("blue_hour", SunDirection.SETTING)],
+            golden_hour_morning=periods[("golden_hour", SunDirection.RISING)],
+            golden_hour_evening=periods[("golden_hour", SunDirection.SETTING)],
             solar_elevation_series=solar_series or None,
         )
     except Exception as e:
@@ -374,31 +578,31 @@ def compute_moon(
     Compute simple moon info via Astral: phase day number and a readable name.
     Adds a smooth illumination heuristic and calculates next new/full moon dates.
     """
-    overall_start = perf_counter()
+    overall_start = perf_counter_ns()
     try:
-        step = perf_counter()
-        phase_day = int(round(moon.phase(on_date)))
+        step = perf_counter_ns()
+        phase_day = _phase_day(on_date)
         _record_metric(metrics, f"{prefix}.phase_ms", step)
 
         # Calculate next new moon and full moon
-        step = perf_counter()
+        step = perf_counter_ns()
         next_new = find_next_moon_phase(on_date, 0)  # 0 = new moon
         next_full = find_next_moon_phase(on_date, 14)  # 14 = full moon
         _record_metric(metrics, f"{prefix}.next_phases_ms", step)
 
-        tzinfo = ZoneInfo(tz_name)
-        observer = Observer(latitude=lat, longitude=lon, elevation=elevation_m)
+        tzinfo = _zi(tz_name)
+        observer = _observer(lat, lon, elevation_m)
         elevation_series = build_hourly_elevation_series(
             observer=observer,
             tzinfo=tzinfo,
             on_date=on_date,
-            compute_fn=moon.elevation,
+            kernel=astro_kernels.moon_elevation,
             metrics=metrics,
             prefix=f"{prefix}.elevation_series",
         )
 
         # Calculate moonrise and moonset
-        step = perf_counter()
+        step = perf_counter_ns()
         moonrise_time = None
         moonset_time = None
         try:
@@ -431,60 +635,219 @@ def compute_moon(
         _record_metric(metrics, f"{prefix}.total_ms", overall_start)
 
 
-def load_links_yaml(path: str) -> list[LinkItem]:
-    p = Path(path)
-    if not p.exists():
-        logger.warning("Links file not found at %s; returning empty list.", path)
-        return []
+_LINK_ITEMS = TypeAdapter(list[LinkItem])
+
+
+@lru_cache(maxsize=8)
+def _load_links_cached(path: str, mtime_ns: int) -> tuple[LinkItem, ...]:
+    """
+    Parse and validate a links file; `mtime_ns` keys out stale entries. A
+    `.json` file (same list-of-rows shape) skips the YAML parser.
+    """
     try:
-        data = yaml.safe_load(p.read_text(encoding="utf-8")) or []
+        if path.endswith(".json"):
+            data = json.loads(Path(path).read_bytes()) or []
+        else:
+            data = yaml.load(Path(path).read_bytes(), Loader=YamlLoader) or []
+        try:
+            # One pydantic-core pass over the whole list in the common case.
+            return tuple(_LINK_ITEMS.validate_python(data))
+        except ValidationError:
+            pass  # re-validate row by row so only the bad rows are dropped
         items = []
         for row in data:
             try:
                 items.append(LinkItem(**row))
             except Exception as e:
                 logger.error("Invalid link row %s: %s", row, e)
-        return items
+        return tuple(items)
     except Exception as e:
-        logger.exception("Failed to read links yaml: %s", e)
+        logger.exception("Failed to read links file: %s", e)
         raise HTTPException(status_code=500, detail="Failed to read links file.")
 
 
-# ---------- Routes ----------
+def is_daylight(sun_times: SunTimes, now_local: datetime) -> bool:
+    """True when `now_local` falls between sunrise and sunset."""
+    return (
+        sun_times.sunrise is not None
+        and sun_times.sunset is not None
+        and sun_times.sunrise <= now_local <= sun_times.sunset
+    )
 
 
-@app.get("/health", response_model=HealthResponse, tags=["meta"])
-def health() -> HealthResponse:
-    return HealthResponse(
-        status="ok", app=settings.app_name, time_utc=datetime.now(timezone.utc)
+AstroKey = tuple[int, int, str, date, int]
+AstroCore = tuple[SunTimes, MoonInfo, Optional[dict[str, float]]]
+
+# _astro_core results, least recently used first. Only the event loop reads or
+# writes it (the threadpool just computes), so a plain dict needs no lock.
+_ASTRO_CACHE_SIZE = 2048
+_astro_results: dict[AstroKey, AstroCore] = {}
+
+
+def _astro_core(
+    lat_q: int, lon_q: int, tz_name: str, on_date: date, elev_q: int
+) -> AstroCore:
+    """
+    Sun and moon data for a quantised location: lat/lon scaled by 100 (~1 km
+    grid) and elevation in whole metres. The result is a pure function of the
+    key, so get_astro keeps it in `_astro_results` and dashboards polling the
+    same spot are served from memory. The metrics describe the computation
+    that filled the entry.
+    """
+    metrics: Optional[dict[str, float]] = {} if settings.profiling_enabled else None
+    lat, lon, elevation_m = lat_q / 100, lon_q / 100, float(elev_q)
+    sun_times = compute_sun_times(
+        lat,
+        lon,
+        tz_name,
+        on_date,
+        elevation_m,
+        metrics=metrics,
+        prefix="sun",
+    )
+    moon_info = compute_moon(
+        lat,
+        lon,
+        tz_name,
+        on_date,
+        elevation_m,
+        metrics=metrics,
+        prefix="moon",
     )
+    return sun_times, moon_info, metrics
 
 
-@app.get("/", response_class=HTMLResponse, tags=["dashboard"])
-def dashboard() -> HTMLResponse:
-    """Serve the static dashboard HTML that lives under /web."""
+def load_links_yaml(path: str) -> list[LinkItem]:
+    """
+    Links from a YAML file, re-parsed only when the file's mtime changes.
+    """
+    try:
+        mtime_ns = Path(path).stat().st_mtime_ns
+    except FileNotFoundError:
+        logger.warning("Links file not found at %s; returning empty list.", path)
+        return []
+    return list(_load_links_cached(path, mtime_ns))
+
+
+def _read_dashboard_template() -> Optional[bytes]:
+    """Read the dashboard once at import; it is static for the process lifetime."""
     template_path = WEB_ROOT / "template.html"
     if not template_path.exists():
         logger.error("Dashboard template missing at %s", template_path)
-        raise HTTPException(status_code=500, detail="Dashboard template missing.")
+        return None
     try:
-        return HTMLResponse(template_path.read_text(encoding="utf-8"))
+        return template_path.read_bytes()
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.exception("Failed to read dashboard template: %s", exc)
-        raise HTTPException(status_code=500, detail="Failed to load dashboard template.")
+        return None
+
+
+_DASHBOARD_HTML = _read_dashboard_template()
+_DASHBOARD_ETAG = (
+    f'"{hashlib.sha1(_DASHBOARD_HTML).hexdigest()}"' if _DASHBOARD_HTML is not None else None
+)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _astro_core_batch(keys: list[AstroKey]) -> list[AstroCore]:
+    return [_astro_core(*key) for key in keys]
+
+
+async def _astro_cores(keys: list[AstroKey]) -> list[AstroCore]:
+    """
+    `_astro_core` results for `keys`, in order, through `_astro_results`.
+    Astral/NumPy work is CPU-bound, so misses are computed off the event loop,
+    all in one threadpool hop. Hits skip the hop entirely, which is most of a
+    cached request's cost.
+    """
+    # Hold the hits locally: while the misses are computed, other requests may
+    # evict them from the shared dict.
+    found = {key: _astro_results[key] for key in keys if key in _astro_results}
+    missing = [key for key in dict.fromkeys(keys) if key not in found]
+    if missing:
+        found.update(zip(missing, await run_in_threadpool(_astro_core_batch, missing)))
+    for key in dict.fromkeys(keys):
+        _astro_results.pop(key, None)
+        _astro_results[key] = found[key]  # most recently used
+    while len(_astro_results) > _ASTRO_CACHE_SIZE:
+        del _astro_results[next(iter(_astro_results))]
+    return [found[key] for key in keys]
+
+
+def _request_timezone(
+    lat: float, lon: float, tz_override: Optional[str], profiling: Optional[dict[str, float]]
+) -> str:
+    """
+    The request's IANA zone, loaded into `_zi` once here so every later use
+    can rely on it. An unknown `tz_override` is the caller's error (400).
+    """
+    if tz_override:
+        try:
+            _zi(tz_override)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise HTTPException(status_code=400, detail=f"Unknown timezone: {tz_override}")
+        return tz_override
+    try:
+        tz_timer = perf_counter_ns()
+        tz_name = resolve_timezone(lat, lon)
+        _zi(tz_name)  # polygon data newer than tzdata fails here, not mid-computation
+        _record_metric(profiling, "resolve_timezone_ms", tz_timer)
+        return tz_name
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Unexpected TZ resolution error: %s", e)
+        raise HTTPException(
+            status_code=500, detail="Internal timezone resolution error."
+        )
+
+
+# ---------- Routes ----------
+
+
+@app.get("/health", response_model=HealthResponse, tags=["meta"])
+async def health() -> HealthResponse:
+    return HealthResponse(
+        status="ok", app=settings.app_name, time_utc=datetime.now(timezone.utc)
+    )
+
+
+@app.get("/", response_class=HTMLResponse, tags=["dashboard"])
+async def dashboard(request: Request) -> Response:
+    """
+    Serve the static dashboard HTML that lives under /web.
+
+    Browsers revalidate with the ETag on each load (`no-cache`), so a deploy
+    shows up immediately while unchanged reloads get an empty 304.
+    """
+    if _DASHBOARD_HTML is None or _DASHBOARD_ETAG is None:
+        raise HTTPException(status_code=500, detail="Dashboard template missing.")
+    headers = {"ETag": _DASHBOARD_ETAG, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), _DASHBOARD_ETAG):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(_DASHBOARD_HTML, headers=headers)
 
 
 @app.get("/links", response_model=LinksResponse, tags=["links"])
-def get_links() -> LinksResponse:
+async def get_links() -> LinksResponse:
     """
     Returns personal service links from a YAML file.
     Replace `sample_links.yaml` with your discovery-pipeline output if desired.
+
+    Async on purpose: a cache hit is one stat() and a dict lookup, cheaper than
+    the threadpool hop a sync handler would take.
     """
     return LinksResponse(links=load_links_yaml(settings.links_file))
 
 
 @app.get("/astro", response_model=AstroResponse, tags=["astro"])
-def get_astro(
+async def get_astro(
     lat: float = Query(..., ge=-90, le=90, description="Latitude in degrees."),
     lon: float = Query(..., ge=-180, le=180, description="Longitude in degrees."),
     date_str: Optional[str] = Query(
@@ -507,53 +870,40 @@ def get_astro(
       * Astral dawn/dusk are civil twilight (~ -6°) by default.
       * Polar edge cases return nulls for events that do not occur.
     """
-    profiling: dict[str, float] = {}
-    request_start = perf_counter()
-
-    try:
-        if tz_override:
-            tz_name = tz_override
-        else:
-            tz_timer = perf_counter()
-            tz_name = resolve_timezone(lat, lon)
-            _record_metric(profiling, "resolve_timezone_ms", tz_timer)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.exception("Unexpected TZ resolution error: %s", e)
-        raise HTTPException(
-            status_code=500, detail="Internal timezone resolution error."
-        )
-
+    profiling: Optional[dict[str, float]] = {} if settings.profiling_enabled else None
+    request_start = perf_counter_ns()
+    # One instant per request: the default date and now_local must agree, even
+    # when the request straddles local midnight.
+    now_utc = datetime.now(timezone.utc)
+
+    # An explicit date needs no timezone, so a malformed one is rejected
+    # before any lookup; only the 'today' default depends on the zone.
+    date_timer = perf_counter_ns()
     try:
-        date_timer = perf_counter()
-        if date_str:
-            on_date = date.fromisoformat(date_str)
-        else:
-            on_date = datetime.now(ZoneInfo(tz_name)).date()
-        _record_metric(profiling, "resolve_date_ms", date_timer)
-    except Exception as e:
+        on_date = date.fromisoformat(date_str) if date_str else None
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid date: {e}")
-
-    sun_times = compute_sun_times(
-        lat,
-        lon,
-        tz_name,
-        on_date,
-        elevation_m,
-        metrics=profiling,
-        prefix="sun",
-    )
-    moon_info = compute_moon(
-        lat,
-        lon,
-        tz_name,
-        on_date,
-        elevation_m,
-        metrics=profiling,
-        prefix="moon",
+    _record_metric(profiling, "resolve_date_ms", date_timer)
+
+    tz_name = _request_timezone(lat, lon, tz_override, profiling)
+
+    if on_date is None:
+        today_timer = perf_counter_ns()
+        on_date = now_utc.astimezone(_zi(tz_name)).date()
+        _record_metric(profiling, "resolve_today_ms", today_timer)
+
+    core_timer = perf_counter_ns()
+    core_key = (round(lat * 100), round(lon * 100), tz_name, on_date, round(elevation_m))
+    ((sun_times, moon_info, core_metrics),) = await _astro_cores([core_key])
+    _record_metric(profiling, "astro_core_ms", core_timer)
+    if profiling is not None and core_metrics:
+        profiling.update(core_metrics)
+
+    # Everything but the wall-clock dependent fields comes from the cache.
+    now_local = now_utc.astimezone(_zi(tz_name))
+    sun_times = sun_times.model_copy(
+        update={"is_daylight_now": is_daylight(sun_times, now_local)}
     )
-    now_local = datetime.now(ZoneInfo(tz_name))
 
     query_model = AstroQuery(
         lat=lat, lon=lon, date=on_date, tz_override=tz_override, elevation_m=elevation_m
@@ -571,19 +921,250 @@ def get_astro(
     )
 
 
-# Optional: Feeds stub (wire your discovery pipeline here)
-@app.get("/feeds", tags=["feeds"])
-def feeds_stub():
+_MAX_RANGE_DAYS = 31
+
+
+@app.get("/astro/range", response_model=AstroRangeResponse, tags=["astro"])
+async def get_astro_range(
+    lat: float = Query(..., ge=-90, le=90, description="Latitude in degrees."),
+    lon: float = Query(..., ge=-180, le=180, description="Longitude in degrees."),
+    start: Optional[str] = Query(
+        default=None,
+        description="First ISO date (YYYY-MM-DD). Defaults to 'today' in local TZ.",
+    ),
+    end: Optional[str] = Query(
+        default=None, description="Last ISO date (YYYY-MM-DD), inclusive."
+    ),
+    days: Optional[int] = Query(
+        default=None,
+        ge=1,
+        le=_MAX_RANGE_DAYS,
+        description="Number of consecutive dates when `end` is not given (default 7).",
+    ),
+    tz_override: Optional[str] = Query(
+        default=None, description="Force a specific IANA TZ."
+    ),
+    elevation_m: float = Query(default=0.0, ge=-430.0, le=9000.0),
+) -> AstroRangeResponse:
     """
-    Minimal stub. Replace with your pipeline (e.g., read from SQLite, Redis, or JSON export).
-    Returning static structure to keep the starter self-contained.
+    Sun and moon data for `start`..`end` (or `days` dates from `start`) at one
+    location, at most 31 dates. Same per-day data as /astro, but the timezone
+    is resolved once and every uncached date is computed in a single
+    threadpool hop.
     """
-    return {
+    now_utc = datetime.now(timezone.utc)
+    try:
+        first = date.fromisoformat(start) if start else None
+        last = date.fromisoformat(end) if end else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid date: {e}")
+    if last is not None and days is not None:
+        raise HTTPException(status_code=400, detail="Pass either end or days, not both.")
+
+    tz_name = _request_timezone(lat, lon, tz_override, None)
+    if first is None:
+        first = now_utc.astimezone(_zi(tz_name)).date()
+    if last is None:
+        days = days or 7
+    else:
+        days = (last - first).days + 1
+        if days < 1:
+            raise HTTPException(status_code=400, detail="end must not be before start.")
+        if days > _MAX_RANGE_DAYS:
+            raise HTTPException(
+                status_code=400, detail=f"A range covers at most {_MAX_RANGE_DAYS} days."
+            )
+    try:
+        dates = [first + timedelta(days=offset) for offset in range(days)]
+    except OverflowError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid date: {e}")
+
+    lat_q, lon_q, elev_q = round(lat * 100), round(lon * 100), round(elevation_m)
+    cores = await _astro_cores([(lat_q, lon_q, tz_name, d, elev_q) for d in dates])
+
+    now_local = now_utc.astimezone(_zi(tz_name))
+    entries = []
+    for on_date, (sun_times, moon_info, _) in zip(dates, cores):
+        sun_times = sun_times.model_copy(
+            update={"is_daylight_now": is_daylight(sun_times, now_local)}
+        )
+        entries.append(AstroDay(date=on_date, sun=sun_times, moon=moon_info))
+
+    return AstroRangeResponse(
+        query=AstroRangeQuery(
+            lat=lat,
+            lon=lon,
+            start=first,
+            end=dates[-1],
+            days=days,
+            tz_override=tz_override,
+            elevation_m=elevation_m,
+        ),
+        timezone=tz_name,
+        now_local=now_local,
+        days=entries,
+    )
+
+
+# Optional: Feeds stub (wire your discovery pipeline here). The payload is
+# static, so it is encoded once, byte-for-byte as JSONResponse would.
+_FEEDS_STUB_BODY = json.dumps(
+    {
         "status": "ok",
         "sources": ["hn", "github_trending", "google_trends", "rss"],
         "items": [],
         "note": "Plug your discovery pipeline here (DB or file).",
-    }
+    },
+    ensure_ascii=False,
+    separators=(",", ":"),
+).encode("utf-8")
+
+
+@app.get("/feeds", tags=["feeds"])
+async def feeds_stub() -> Response:
+    """
+    Minimal stub. Replace with your pipeline (e.g., read from SQLite, Redis, or JSON export).
+    Returning static structure to keep the starter self-contained.
+    """
+    return Response(content=_FEEDS_STUB_BODY, media_type="application/json")
+
+
+# One pooled client for the weather provider, so keep-alive connections (and the
+# TLS handshake behind them) are reused across requests. Closed by `lifespan`.
+_weather_client: Optional[httpx.AsyncClient] = None
+
+
+def _weather_http() -> httpx.AsyncClient:
+    global _weather_client
+    if _weather_client is None or _weather_client.is_closed:
+        _weather_client = httpx.AsyncClient(
+            timeout=10.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _weather_client
+
+
+def _weather_condition(condition: WeatherApiCondition) -> WeatherCondition:
+    return WeatherCondition(text=condition.text, icon=condition.icon, code=condition.code)
+
+
+# Normalised weather per (lat, lon rounded to 0.01°, days). Values hold the fetch
+# task, so concurrent requests for the same cell share one upstream call.
+WeatherKey = tuple[float, float, int]
+_WEATHER_CACHE_SIZE = 2048
+_weather_cache: dict[WeatherKey, tuple[float, asyncio.Task[WeatherResponse]]] = {}
+
+
+def _prune_weather_cache(now: float) -> None:
+    if len(_weather_cache) < _WEATHER_CACHE_SIZE:
+        return
+    for key in [k for k, (expires, _) in _weather_cache.items() if expires <= now]:
+        del _weather_cache[key]
+    while len(_weather_cache) >= _WEATHER_CACHE_SIZE:
+        del _weather_cache[next(iter(_weather_cache))]
+
+
+def _forget_failed_weather(
+    key: WeatherKey, entry: tuple[float, asyncio.Task[WeatherResponse]], task: asyncio.Task
+) -> None:
+    # Only successful responses are cached; errors are retried on the next request.
+    if (task.cancelled() or task.exception() is not None) and _weather_cache.get(key) is entry:
+        del _weather_cache[key]
+
+
+async def _fetch_weather(lat: float, lon: float, days: int) -> WeatherResponse:
+    """Fetch from WeatherAPI.com and normalise to WeatherResponse."""
+    try:
+        # WeatherAPI.com endpoint - use forecast.json if days > 0, otherwise current.json
+        if days > 0:
+            url = f"{settings.weatherapi_url}forecast.json"
+            params = {
+                "key": settings.weatherapi_key,
+                "q": f"{lat},{lon}",
+                "days": days,
+                "aqi": "no",
+            }
+        else:
+            url = f"{settings.weatherapi_url}current.json"
+            params = {
+                "key": settings.weatherapi_key,
+                "q": f"{lat},{lon}",
+                "aqi": "no",
+            }
+
+        response = await _weather_http().get(url, params=params)
+        response.raise_for_status()
+
+        # Parse straight from bytes into the fields we use; the rest of the
+        # payload is skipped rather than materialised as Python objects.
+        data = WeatherApiPayload.model_validate_json(response.content)
+        location = data.location
+        current = data.current
+
+        # Parse forecast data if available
+        forecast = None
+        if days > 0 and data.forecast is not None:
+            forecast = WeatherForecast(
+                days=[
+                    ForecastDay(
+                        date=day_data.date,
+                        date_epoch=day_data.date_epoch,
+                        max_temp_c=day_data.day.maxtemp_c,
+                        max_temp_f=day_data.day.maxtemp_f,
+                        min_temp_c=day_data.day.mintemp_c,
+                        min_temp_f=day_data.day.mintemp_f,
+                        avg_temp_c=day_data.day.avgtemp_c,
+                        avg_temp_f=day_data.day.avgtemp_f,
+                        max_wind_kph=day_data.day.maxwind_kph,
+                        max_wind_mph=day_data.day.maxwind_mph,
+                        total_precip_mm=day_data.day.totalprecip_mm,
+                        avg_humidity=day_data.day.avghumidity,
+                        condition=_weather_condition(day_data.day.condition),
+                        uv=day_data.day.uv,
+                        daily_chance_of_rain=day_data.day.daily_chance_of_rain,
+                        daily_chance_of_snow=day_data.day.daily_chance_of_snow,
+                    )
+                    for day_data in data.forecast.forecastday
+                ]
+            )
+
+        return WeatherResponse(
+            location=location.name,
+            region=location.region,
+            country=location.country,
+            localtime=location.localtime,
+            current=WeatherCurrent(
+                temp_c=current.temp_c,
+                temp_f=current.temp_f,
+                feels_like_c=current.feelslike_c,
+                feels_like_f=current.feelslike_f,
+                humidity=current.humidity,
+                wind_kph=current.wind_kph,
+                wind_mph=current.wind_mph,
+                wind_dir=current.wind_dir,
+                pressure_mb=current.pressure_mb,
+                precip_mm=current.precip_mm,
+                condition=_weather_condition(current.condition),
+                uv=current.uv,
+            ),
+            forecast=forecast,
+        )
+
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Weather API HTTP error: {e.response.status_code}")
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Weather API error: {e.response.text}",
+        )
+    except httpx.RequestError as e:
+        logger.error(f"Weather API request error: {e}")
+        raise HTTPException(
+            status_code=503, detail="Unable to reach weather service"
+        )
+    except Exception as e:
+        logger.exception(f"Unexpected weather API error: {e}")
+        raise HTTPException(status_code=500, detail="Internal weather service error")
 
 
 @app.get("/weather", response_model=WeatherResponse, tags=["weather"])
@@ -611,106 +1192,19 @@ async def get_weather(
             detail="Weather service not configured. Set WEATHERAPI_KEY in environment.",
         )
 
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # WeatherAPI.com endpoint - use forecast.json if days > 0, otherwise current.json
-            if days > 0:
-                url = f"{settings.weatherapi_url}forecast.json"
-                params = {
-                    "key": settings.weatherapi_key,
-                    "q": f"{lat},{lon}",
-                    "days": days,
-                    "aqi": "no",
-                }
-            else:
-                url = f"{settings.weatherapi_url}current.json"
-                params = {
-                    "key": settings.weatherapi_key,
-                    "q": f"{lat},{lon}",
-                    "aqi": "no",
-                }
-
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            # Normalize response to our format
-            location_data = data.get("location", {})
-            current_data = data.get("current", {})
-            condition_data = current_data.get("condition", {})
-
-            # Parse forecast data if available
-            forecast = None
-            if days > 0 and "forecast" in data:
-                forecast_data = data["forecast"].get("forecastday", [])
-                forecast_days = []
-                for day_data in forecast_data:
-                    day = day_data.get("day", {})
-                    day_condition = day.get("condition", {})
-                    forecast_days.append(ForecastDay(
-                        date=day_data.get("date", ""),
-                        date_epoch=day_data.get("date_epoch", 0),
-                        max_temp_c=day.get("maxtemp_c", 0.0),
-                        max_temp_f=day.get("maxtemp_f", 0.0),
-                        min_temp_c=day.get("mintemp_c", 0.0),
-                        min_temp_f=day.get("mintemp_f", 0.0),
-                        avg_temp_c=day.get("avgtemp_c", 0.0),
-                        avg_temp_f=day.get("avgtemp_f", 0.0),
-                        max_wind_kph=day.get("maxwind_kph", 0.0),
-                        max_wind_mph=day.get("maxwind_mph", 0.0),
-                        total_precip_mm=day.get("totalprecip_mm", 0.0),
-                        avg_humidity=day.get("avghumidity", 0),
-                        condition=WeatherCondition(
-                            text=day_condition.get("text", "Unknown"),
-                            icon=day_condition.get("icon", ""),
-                            code=day_condition.get("code", 0),
-                        ),
-                        uv=day.get("uv", 0.0),
-                        daily_chance_of_rain=day.get("daily_chance_of_rain", 0),
-                        daily_chance_of_snow=day.get("daily_chance_of_snow", 0),
-                    ))
-                forecast = WeatherForecast(days=forecast_days)
-
-            return WeatherResponse(
-                location=location_data.get("name", "Unknown"),
-                region=location_data.get("region"),
-                country=location_data.get("country", "Unknown"),
-                localtime=location_data.get("localtime", ""),
-                current=WeatherCurrent(
-                    temp_c=current_data.get("temp_c", 0.0),
-                    temp_f=current_data.get("temp_f", 0.0),
-                    feels_like_c=current_data.get("feelslike_c", 0.0),
-                    feels_like_f=current_data.get("feelslike_f", 0.0),
-                    humidity=current_data.get("humidity", 0),
-                    wind_kph=current_data.get("wind_kph", 0.0),
-                    wind_mph=current_data.get("wind_mph", 0.0),
-                    wind_dir=current_data.get("wind_dir", ""),
-                    pressure_mb=current_data.get("pressure_mb", 0.0),
-                    precip_mm=current_data.get("precip_mm", 0.0),
-                    condition=WeatherCondition(
-                        text=condition_data.get("text", "Unknown"),
-                        icon=condition_data.get("icon", ""),
-                        code=condition_data.get("code", 0),
-                    ),
-                    uv=current_data.get("uv", 0.0),
-                ),
-                forecast=forecast,
-            )
-
-    except httpx.HTTPStatusError as e:
-        logger.error(f"Weather API HTTP error: {e.response.status_code}")
-        raise HTTPException(
-            status_code=e.response.status_code,
-            detail=f"Weather API error: {e.response.text}",
-        )
-    except httpx.RequestError as e:
-        logger.error(f"Weather API request error: {e}")
-        raise HTTPException(
-            status_code=503, detail="Unable to reach weather service"
-        )
-    except Exception as e:
-        logger.exception(f"Unexpected weather API error: {e}")
-        raise HTTPException(status_code=500, detail="Internal weather service error")
+    key = (round(lat, 2), round(lon, 2), days)
+    now = monotonic()
+    entry = _weather_cache.get(key)
+    if entry is None or entry[0] <= now:
+        _prune_weather_cache(now)
+        task = asyncio.create_task(_fetch_weather(*key))
+        entry = (now + settings.cache_ttl_seconds, task)
+        # Re-insert rather than overwrite, so a refreshed key is the newest.
+        _weather_cache.pop(key, None)
+        _weather_cache[key] = entry
+        task.add_done_callback(partial(_forget_failed_weather, key, entry))
+    # Shielded: one client disconnecting must not cancel a fetch others await.
+    return await asyncio.shield(entry[1])
 
 
 def create_app() -> FastAPI:
@@ -57,14 +57,20 @@ class SunTimes(BaseModel):
     blue_hour_evening: Optional[TimePeriod] = None
     golden_hour_morning: Optional[TimePeriod] = None
     golden_hour_evening: Optional[TimePeriod] = None
-    solar_elevation_series: Optional[Dict[str, float]] = None
+    solar_elevation_series: Optional[Dict[str, int]] = Field(
+        default=None,
+        description="Hourly solar elevation in hundredths of a degree (divide by 100).",
+    )
 
 
 class MoonInfo(BaseModel):
     phase_day_0_29: int
     phase_name: str
     illumination_fraction_est: float = Field(..., ge=0.0, le=1.0)  # heuristic
-    elevation_series: Optional[Dict[str, float]] = None
+    elevation_series: Optional[Dict[str, int]] = Field(
+        default=None,
+        description="Hourly lunar elevation in hundredths of a degree (divide by 100).",
+    )
     next_new_moon: Optional[Date] = None
     next_full_moon: Optional[Date] = None
     moonrise: Optional[datetime] = None
@@ -72,6 +78,8 @@ class MoonInfo(BaseModel):
 
 
 class AstroResponse(BaseModel):
+    """Elevation series under `sun` and `moon` are integer centidegrees (/100)."""
+
     query: AstroQuery
     timezone: str
     now_local: datetime
@@ -80,6 +88,31 @@ class AstroResponse(BaseModel):
     profiling_ms: Optional[Dict[str, float]] = None
 
 
+class AstroRangeQuery(BaseModel):
+    lat: float = Field(..., ge=-90, le=90)
+    lon: float = Field(..., ge=-180, le=180)
+    start: Date
+    end: Date
+    days: int = Field(..., ge=1, le=31)
+    tz_override: Optional[str] = None
+    elevation_m: float = Field(default=0.0, ge=-430.0, le=9000.0)
+
+
+class AstroDay(BaseModel):
+    date: Date
+    sun: SunTimes
+    moon: MoonInfo
+
+
+class AstroRangeResponse(BaseModel):
+    """One entry per date, oldest first; series are centidegrees as in AstroResponse."""
+
+    query: AstroRangeQuery
+    timezone: str
+    now_local: datetime
+    days: List[AstroDay]
+
+
 class LinksResponse(BaseModel):
     links: List[LinkItem]
 
@@ -135,3 +168,70 @@ class WeatherResponse(BaseModel):
     localtime: str
     current: WeatherCurrent
     forecast: Optional[WeatherForecast] = None
+
+
+# ---------- WeatherAPI.com payload ----------
+# Only the fields get_weather normalises; everything else in the upstream JSON
+# (notably the 24 hourly entries per forecast day) is skipped while parsing.
+# Defaults stand in for fields the provider omits.
+
+
+class WeatherApiCondition(BaseModel):
+    text: str = "Unknown"
+    icon: str = ""
+    code: int = 0
+
+
+class WeatherApiLocation(BaseModel):
+    name: str = "Unknown"
+    region: Optional[str] = None
+    country: str = "Unknown"
+    localtime: str = ""
+
+
+class WeatherApiCurrent(BaseModel):
+    temp_c: float = 0.0
+    temp_f: float = 0.0
+    feelslike_c: float = 0.0
+    feelslike_f: float = 0.0
+    humidity: int = 0
+    wind_kph: float = 0.0
+    wind_mph: float = 0.0
+    wind_dir: str = ""
+    pressure_mb: float = 0.0
+    precip_mm: float = 0.0
+    condition: WeatherApiCondition = Field(default_factory=WeatherApiCondition)
+    uv: float = 0.0
+
+
+class WeatherApiDay(BaseModel):
+    maxtemp_c: float = 0.0
+    maxtemp_f: float = 0.0
+    mintemp_c: float = 0.0
+    mintemp_f: float = 0.0
+    avgtemp_c: float = 0.0
+    avgtemp_f: float = 0.0
+    maxwind_kph: float = 0.0
+    maxwind_mph: float = 0.0
+    totalprecip_mm: float = 0.0
+    avghumidity: int = 0
+    condition: WeatherApiCondition = Field(default_factory=WeatherApiCondition)
+    uv: float = 0.0
+    daily_chance_of_rain: int = 0
+    daily_chance_of_snow: int = 0
+
+
+class WeatherApiForecastDay(BaseModel):
+    date: str = ""
+    date_epoch: int = 0
+    day: WeatherApiDay = Field(default_factory=WeatherApiDay)
+
+
+class WeatherApiForecast(BaseModel):
+    forecastday: List[WeatherApiForecastDay] = Field(default_factory=list)
+
+
+class WeatherApiPayload(BaseModel):
+    location: WeatherApiLocation = Field(default_factory=WeatherApiLocation)
+    current: WeatherApiCurrent = Field(default_factory=WeatherApiCurrent)
+    forecast: Optional[WeatherApiForecast] = None
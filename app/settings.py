@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import List
+from typing import List, Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -25,7 +25,18 @@ class Settings(BaseSettings):
     # Weather API settings
     weatherapi_key: str = ""
     weatherapi_url: str = "http://api.weatherapi.com/v1/"
-    cache_ttl_seconds: int = 3600
+    # How long a /weather response is reused for the same ~1 km cell
+    cache_ttl_seconds: int = 300
+
+    # Timezone polygon lookups: "auto" uses tzfpy when installed (speedups
+    # extra), "timezonefinder" forces the pure-Python finder
+    timezone_backend: Literal["auto", "tzfpy", "timezonefinder"] = "auto"
+    # Load timezonefinder's polygon data into RAM instead of reading the
+    # memory-mapped data files (about 30 MB more per worker, barely faster)
+    timezone_in_memory: bool = False
+
+    # Per-step timings in /astro responses (`profiling_ms`)
+    profiling_enabled: bool = False
 
     # Safety knobs
     max_abs_lat: float = 90.0
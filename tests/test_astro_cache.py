@@ -0,0 +1,52 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from app import main
+
+
+@pytest.fixture
+def fake_core(monkeypatch):
+    """Small cache and a trivial core so only the cache bookkeeping is exercised."""
+    monkeypatch.setattr(main, "_ASTRO_CACHE_SIZE", 2)
+    monkeypatch.setattr(main, "_astro_results", {})
+    monkeypatch.setattr(main, "_astro_core", lambda *key: ("core", key))
+
+
+def _key(n: int) -> main.AstroKey:
+    return (n, 0, "UTC", date(2024, 1, 1), 0)
+
+
+def test_hits_and_misses_keep_request_order(fake_core):
+    hit, miss = _key(1), _key(2)
+    main._astro_results[hit] = ("core", hit)
+
+    cores = asyncio.run(main._astro_cores([miss, hit]))
+
+    assert cores == [("core", miss), ("core", hit)]
+    assert list(main._astro_results) == [miss, hit]
+
+
+def test_hit_survives_eviction_during_pending_miss(fake_core, monkeypatch):
+    hit, slow_miss = _key(1), _key(2)
+    main._astro_results[hit] = ("core", hit)
+    other_done = asyncio.Event()
+
+    async def threadpool(fn, keys):
+        if slow_miss in keys:
+            await other_done.wait()
+        return fn(keys)
+
+    monkeypatch.setattr(main, "run_in_threadpool", threadpool)
+
+    async def scenario():
+        slow = asyncio.create_task(main._astro_cores([hit, slow_miss]))
+        await asyncio.sleep(0)  # let it take its hit and start computing
+        await main._astro_cores([_key(3), _key(4)])  # fills the cache, evicts `hit`
+        assert hit not in main._astro_results
+        other_done.set()
+        return await slow
+
+    assert asyncio.run(scenario()) == [("core", hit), ("core", slow_miss)]
+    assert len(main._astro_results) == 2
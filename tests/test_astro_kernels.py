@@ -0,0 +1,166 @@
+"""
+The NumPy/numba kernels and the batched sun solver re-implement Astral's math;
+these tests pin them to `astral.sun` / `astral.moon` so a change to either side
+cannot silently drift.
+"""
+
+import math
+import random
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+from astral import Observer, moon
+from astral import sun as astral_sun
+from astral.sun import SunDirection, minutes_to_timedelta, time_of_transit
+
+from app import astro_kernels
+from app.main import compute_moon, compute_sun_times
+
+# Kernel vs Astral agreement seen in practice is ~1e-7° and ~2 µs; the bounds
+# leave headroom without hiding a real formula change.
+ELEVATION_TOL_DEG = 1e-6
+TIME_TOL_S = 1e-5
+
+# (lat, lon, tz, date, elevation_m): polar day/night, DST switch days, the
+# date line (events that land on the neighbouring local day), high elevation.
+SUN_CASES = [
+    (51.5, -0.12, "Europe/London", date(2025, 3, 30), 0.0),
+    (51.5, -0.12, "Europe/London", date(2025, 10, 26), 0.0),
+    (40.71, -74.01, "America/New_York", date(2025, 3, 9), 0.0),
+    (-33.87, 151.21, "Australia/Sydney", date(2025, 4, 6), 0.0),
+    (69.65, 18.96, "Europe/Oslo", date(2025, 6, 21), 0.0),
+    (69.65, 18.96, "Europe/Oslo", date(2025, 12, 21), 0.0),
+    (78.22, 15.65, "Arctic/Longyearbyen", date(2025, 4, 20), 0.0),
+    (-77.85, 166.67, "Antarctica/McMurdo", date(2025, 1, 10), 0.0),
+    (1.87, -157.4, "Pacific/Kiritimati", date(2025, 7, 1), 0.0),
+    (-14.28, -170.7, "Pacific/Pago_Pago", date(2025, 7, 1), 0.0),
+    (27.99, 86.93, "Asia/Kathmandu", date(2025, 5, 29), 8849.0),
+    (46.55, 7.98, "Europe/Zurich", date(2025, 9, 23), 3454.0),
+]
+
+
+def _random_sun_cases(n: int, seed: int) -> list[tuple[float, float, str, date, float]]:
+    rng = random.Random(seed)
+    zones = ["UTC", "Europe/London", "America/Los_Angeles", "Asia/Tokyo", "Pacific/Auckland"]
+    return [
+        (
+            rng.uniform(-89.0, 89.0),
+            rng.uniform(-180.0, 180.0),
+            rng.choice(zones),
+            date(2020, 1, 1) + timedelta(days=rng.randrange(3653)),
+            rng.choice([0.0, 0.0, 500.0, 3000.0]),
+        )
+        for _ in range(n)
+    ]
+
+
+def _safe(fn, *args):
+    try:
+        return fn(*args)
+    except ValueError:
+        return None
+
+
+def _assert_same_time(got, expected, label):
+    if expected is None:
+        assert got is None, f"{label}: expected no event, got {got}"
+    else:
+        assert got is not None, f"{label}: expected {expected}, got None"
+        assert abs((got - expected).total_seconds()) <= TIME_TOL_S, label
+
+
+def _utc_hours(day: date) -> tuple[list[datetime], np.ndarray]:
+    instants = [
+        datetime(day.year, day.month, day.day, tzinfo=timezone.utc) + timedelta(hours=h)
+        for h in range(24)
+    ]
+    jd = np.array([t.timestamp() for t in instants]) / 86400.0 + 2440587.5
+    return instants, jd
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_sun_and_moon_elevation_match_astral_on_utc_series(seed):
+    rng = random.Random(seed)
+    for i in range(50):
+        lat = 90.0 if i == 0 else rng.uniform(-90.0, 90.0)
+        lon = rng.uniform(-180.0, 180.0)
+        instants, jd = _utc_hours(date(1990, 1, 1) + timedelta(days=rng.randrange(18262)))
+        observer = Observer(lat, lon)
+
+        sun = [astral_sun.elevation(observer, t) for t in instants]
+        np.testing.assert_allclose(
+            astro_kernels.sun_elevation(jd, lat, lon), sun, rtol=0, atol=ELEVATION_TOL_DEG
+        )
+        lunar = [moon.elevation(observer, t) for t in instants]
+        np.testing.assert_allclose(
+            astro_kernels.moon_elevation(jd, lat, lon), lunar, rtol=0, atol=ELEVATION_TOL_DEG
+        )
+
+
+def test_sun_transit_minutes_match_time_of_transit():
+    zeniths = np.array([90.0 + astral_sun.SUN_APPARENT_RADIUS, 96.0, 102.0, 108.0, 84.0] * 2)
+    setting = np.array([False] * 5 + [True] * 5)
+    for lat, lon, _, day, elevation_m in SUN_CASES + _random_sun_cases(300, seed=2):
+        minutes = astro_kernels.sun_transit_minutes(day, lat, lon, elevation_m, zeniths, setting)
+        observer = Observer(lat, lon, elevation_m)
+        midnight = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+        for zenith, sets, m in zip(zeniths, setting, minutes):
+            direction = SunDirection.SETTING if sets else SunDirection.RISING
+            expected = _safe(time_of_transit, observer, day, zenith, direction)
+            got = None if math.isnan(m) else midnight + minutes_to_timedelta(m)
+            _assert_same_time(got, expected, f"{lat},{lon} {day} z={zenith} {direction.name}")
+
+
+@pytest.mark.parametrize(
+    "lat, lon, tz_name, day, elevation_m", SUN_CASES + _random_sun_cases(150, seed=7)
+)
+def test_sun_times_match_astral(lat, lon, tz_name, day, elevation_m):
+    sun = compute_sun_times(lat, lon, tz_name, day, elevation_m)
+    observer = Observer(lat, lon, elevation_m)
+    tz = ZoneInfo(tz_name)
+
+    expected = {
+        "sunrise": _safe(astral_sun.sunrise, observer, day, tz),
+        "sunset": _safe(astral_sun.sunset, observer, day, tz),
+        "solar_noon": _safe(astral_sun.noon, observer, day, tz),
+    }
+    for name, depression in (("civil", 6.0), ("nautical", 12.0), ("astronomical", 18.0)):
+        expected[f"{name}_dawn"] = _safe(astral_sun.dawn, observer, day, depression, tz)
+        expected[f"{name}_dusk"] = _safe(astral_sun.dusk, observer, day, depression, tz)
+    for field, value in expected.items():
+        _assert_same_time(getattr(sun, field), value, f"{field} {lat},{lon} {tz_name} {day}")
+
+    for field, fn, direction in (
+        ("blue_hour_morning", astral_sun.blue_hour, SunDirection.RISING),
+        ("blue_hour_evening", astral_sun.blue_hour, SunDirection.SETTING),
+        ("golden_hour_morning", astral_sun.golden_hour, SunDirection.RISING),
+        ("golden_hour_evening", astral_sun.golden_hour, SunDirection.SETTING),
+    ):
+        window = _safe(fn, observer, day, direction, tz)
+        period = getattr(sun, field)
+        if window is None:
+            assert period is None, field
+        else:
+            assert period is not None, field
+            _assert_same_time(period.start, window[0], f"{field}.start")
+            _assert_same_time(period.end, window[1], f"{field}.end")
+
+
+@pytest.mark.parametrize("lat, lon, tz_name, day, elevation_m", SUN_CASES)
+def test_hourly_series_match_astral_at_local_hours(lat, lon, tz_name, day, elevation_m):
+    observer = Observer(lat, lon, elevation_m)
+    sun = compute_sun_times(lat, lon, tz_name, day, elevation_m).solar_elevation_series
+    lunar = compute_moon(lat, lon, tz_name, day, elevation_m).elevation_series
+
+    assert len(sun) == len(lunar) == 24
+    for key, centidegrees in sun.items():
+        expected = astral_sun.elevation(observer, datetime.fromisoformat(key))
+        assert abs(centidegrees - expected * 100) <= 0.5 + 1e-4, key
+    for key, centidegrees in lunar.items():
+        # astral.moon.elevation reads an aware datetime's wall-clock fields and
+        # ignores the offset, so it has to be handed the UTC instant.
+        instant = datetime.fromisoformat(key).astimezone(timezone.utc)
+        expected = moon.elevation(observer, instant)
+        assert abs(centidegrees - expected * 100) <= 0.5 + 1e-4, key
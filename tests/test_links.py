@@ -0,0 +1,36 @@
+import json
+
+from app.main import load_links_yaml
+from app.models import LinkItem
+
+
+def test_json_links_file_loads(tmp_path):
+    path = tmp_path / "links.json"
+    path.write_text(
+        json.dumps(
+            [
+                {"name": "Grafana", "url": "https://grafana.example", "group": "ops"},
+                {"name": "Jellyfin", "url": "https://media.example", "icon": "tv"},
+            ]
+        )
+    )
+
+    assert load_links_yaml(str(path)) == [
+        LinkItem(name="Grafana", url="https://grafana.example", group="ops"),
+        LinkItem(name="Jellyfin", url="https://media.example", icon="tv"),
+    ]
+
+
+def test_json_links_file_skips_bad_rows(tmp_path):
+    path = tmp_path / "links.json"
+    path.write_text(
+        json.dumps(
+            [
+                {"name": "Grafana", "url": "https://grafana.example"},
+                {"name": "No URL"},
+                {"name": "Jellyfin", "url": "https://media.example"},
+            ]
+        )
+    )
+
+    assert [link.name for link in load_links_yaml(str(path))] == ["Grafana", "Jellyfin"]
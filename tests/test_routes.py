@@ -0,0 +1,102 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import _DASHBOARD_ETAG, app, compute_sun_times
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "path, params",
+    [
+        ("/astro", {"lat": 51.5, "lon": -0.1, "tz_override": "Bad/Zone"}),
+        ("/astro", {"lat": 51.5, "lon": -0.1, "tz_override": "Bad/Zone", "date_str": "2024-01-01"}),
+        ("/astro/range", {"lat": 51.5, "lon": -0.1, "tz_override": "Bad/Zone"}),
+        (
+            "/astro/range",
+            {"lat": 51.5, "lon": -0.1, "tz_override": "Bad/Zone", "start": "2024-01-01"},
+        ),
+    ],
+)
+def test_unknown_tz_override_is_a_client_error(path, params):
+    response = client.get(path, params=params)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown timezone: Bad/Zone"
+
+
+@pytest.mark.parametrize(
+    "path, params",
+    [
+        ("/astro", {"lat": 51.5, "lon": -0.1, "date_str": "nope"}),
+        ("/astro/range", {"lat": 51.5, "lon": -0.1, "start": "nope"}),
+        ("/astro/range", {"lat": 51.5, "lon": -0.1, "start": "9999-12-30", "days": 5}),
+        ("/astro/range", {"lat": 51.5, "lon": -0.1, "start": "2025-01-01", "end": "nope"}),
+    ],
+)
+def test_invalid_date_is_a_client_error(path, params):
+    response = client.get(path, params=params)
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Invalid date")
+
+
+def test_range_days_match_single_date_responses():
+    params = {"lat": 69.6492, "lon": 18.9553, "tz_override": "Europe/Oslo"}
+    days = client.get("/astro/range", params={**params, "start": "2025-06-20", "days": 3}).json()
+    single = client.get("/astro", params={**params, "date_str": "2025-06-21"}).json()
+
+    assert [d["date"] for d in days["days"]] == ["2025-06-20", "2025-06-21", "2025-06-22"]
+    assert days["days"][1]["sun"] == single["sun"]
+    assert days["days"][1]["moon"] == single["moon"]
+
+
+def test_range_end_is_inclusive():
+    params = {"lat": 51.5, "lon": -0.1, "tz_override": "UTC"}
+    body = client.get(
+        "/astro/range", params={**params, "start": "2025-01-30", "end": "2025-02-01"}
+    ).json()
+
+    assert [d["date"] for d in body["days"]] == ["2025-01-30", "2025-01-31", "2025-02-01"]
+    assert body["query"]["end"] == "2025-02-01"
+    assert body["query"]["days"] == 3
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"start": "2025-01-02", "end": "2025-01-01"},
+        {"start": "2025-01-01", "end": "2025-02-01"},  # 32 dates
+        {"start": "2025-01-01", "end": "2025-01-07", "days": 7},
+    ],
+)
+def test_bad_range_bounds_are_a_client_error(params):
+    response = client.get("/astro/range", params={"lat": 51.5, "lon": -0.1, **params})
+    assert response.status_code == 400
+
+
+def test_daylight_flag_is_filled_per_request_not_cached():
+    sun = compute_sun_times(51.5, -0.1, "Europe/London", date(2025, 6, 21), 0.0)
+    assert sun.is_daylight_now is None
+
+    polar_night = {"lat": 78.0, "lon": 15.0, "date_str": "2025-12-21"}
+    assert client.get("/astro", params=polar_night).json()["sun"]["is_daylight_now"] is False
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [_DASHBOARD_ETAG, f"W/{_DASHBOARD_ETAG}", f'"stale", {_DASHBOARD_ETAG}', "*"],
+)
+def test_dashboard_revalidation_with_matching_etag_is_304(if_none_match):
+    response = client.get("/", headers={"If-None-Match": if_none_match})
+    assert response.status_code == 304
+    assert response.headers["etag"] == _DASHBOARD_ETAG
+    assert response.content == b""
+
+
+def test_dashboard_with_stale_etag_gets_the_page():
+    response = client.get("/", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.headers["etag"] == _DASHBOARD_ETAG
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.content.startswith(b"<!")
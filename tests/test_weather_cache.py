@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app import main
+
+
+class FakeWeather:
+    """Stands in for _fetch_weather: counts calls and can hold them on a gate."""
+
+    def __init__(self):
+        self.calls = []
+        self.gate = None
+        self.error = None
+
+    async def __call__(self, lat, lon, days):
+        self.calls.append((lat, lon, days))
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return ("weather", lat, lon, days, len(self.calls))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(main, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def fetch(monkeypatch, clock):
+    fake = FakeWeather()
+    monkeypatch.setattr(main, "_fetch_weather", fake)
+    monkeypatch.setattr(main, "_weather_cache", {})
+    monkeypatch.setattr(main.settings, "weatherapi_key", "test")
+    monkeypatch.setattr(main.settings, "cache_ttl_seconds", 300)
+    return fake
+
+
+def _weather(lat=51.5, lon=-0.12, days=0):
+    return main.get_weather(lat=lat, lon=lon, days=days)
+
+
+def test_concurrent_callers_share_one_fetch(fetch):
+    async def scenario():
+        fetch.gate = asyncio.Event()
+        first = asyncio.create_task(_weather())
+        second = asyncio.create_task(_weather(lat=51.501))  # same 0.01° cell
+        await asyncio.sleep(0)
+        fetch.gate.set()
+        return await first, await second
+
+    first, second = asyncio.run(scenario())
+    assert first is second
+    assert fetch.calls == [(51.5, -0.12, 0)]
+
+
+def test_expired_entry_is_fetched_again(fetch, clock):
+    async def scenario():
+        first = await _weather()
+        clock[0] += 299
+        assert await _weather() is first
+        clock[0] += 1
+        return first, await _weather()
+
+    first, refreshed = asyncio.run(scenario())
+    assert refreshed != first
+    assert len(fetch.calls) == 2
+
+
+def test_failed_fetch_is_not_cached(fetch):
+    async def scenario():
+        fetch.error = HTTPException(status_code=503, detail="Unable to reach weather service")
+        with pytest.raises(HTTPException):
+            await _weather()
+        assert main._weather_cache == {}
+        fetch.error = None
+        return await _weather()
+
+    assert asyncio.run(scenario())[-1] == 2
+    assert len(main._weather_cache) == 1
+
+
+def test_cancelled_fetch_is_not_cached(fetch):
+    async def scenario():
+        fetch.gate = asyncio.Event()
+        caller = asyncio.create_task(_weather())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)  # the fetch is now in flight
+        assert len(fetch.calls) == 1
+        ((_, task),) = main._weather_cache.values()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        assert main._weather_cache == {}
+        fetch.gate.set()
+        return await _weather()
+
+    assert asyncio.run(scenario())[-1] == 2
+
+
+def test_cancelled_caller_does_not_cancel_shared_fetch(fetch):
+    async def scenario():
+        fetch.gate = asyncio.Event()
+        leaving = asyncio.create_task(_weather())
+        staying = asyncio.create_task(_weather())
+        await asyncio.sleep(0)
+        leaving.cancel()
+        await asyncio.sleep(0)
+        fetch.gate.set()
+        result = await staying
+        assert leaving.cancelled()
+        return result
+
+    assert asyncio.run(scenario()) == ("weather", 51.5, -0.12, 0, 1)
+    assert len(fetch.calls) == 1
+    ((_, task),) = main._weather_cache.values()
+    assert not task.cancelled()
+
+
+def test_refreshed_entry_is_evicted_after_older_live_ones(fetch, clock, monkeypatch):
+    monkeypatch.setattr(main, "_WEATHER_CACHE_SIZE", 3)
+    a, b, c, d = ((float(n), 0.0, 0) for n in range(4))
+
+    async def scenario():
+        await _weather(*a)
+        clock[0] += 200
+        await _weather(*b)
+        clock[0] += 150  # `a` has expired, `b` is still live
+        await _weather(*a)
+        clock[0] += 10
+        await _weather(*c)
+        await _weather(*d)  # at capacity: the oldest live entry, `b`, goes
+
+    asyncio.run(scenario())
+    assert list(main._weather_cache) == [a, c, d]